@@ -1,24 +1,63 @@
 # ============================================================================
 # IMPORTACIONES
 # ============================================================================
+import array      # Para compartir el progreso de los hilos sin cerrojos
+import functools  # Para reutilizar las palabras clave ya preparadas
+import mmap       # Para proyectar el fichero en memoria
+import os         # Para abrir el fichero a bajo nivel
+import re         # Para buscar varias palabras clave en una sola pasada
+import stat       # Para distinguir ficheros regulares de tuberías
 import threading  # Para crear y gestionar hilos
-import time       # Para pausas y simulación de procesamiento lento
+import sys        # Para escribir en la salida estándar y vaciar su búfer
 import random     # Para generar datos aleatorios en el fichero
+from concurrent.futures import ThreadPoolExecutor  # Para contar tramos en paralelo
 from datetime import datetime  # Para mostrar fecha y hora
 
+# NumPy y Numba son opcionales: si están instalados, el bucle de conteo se
+# compila a código nativo que libera el GIL (los tramos del fichero se cuentan
+# realmente en paralelo); si no, se usa mm.find
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+# Extensión en Cython opcional (count_ext.pyx). Si está compilada, tiene
+# prioridad sobre Numba y mm.find
+try:
+    import count_ext
+except ImportError:
+    count_ext = None
+
 # ============================================================================
 # VARIABLES GLOBALES
 # ============================================================================
-# Variable compartida que almacena el número de líneas con "ERROR"
-# Esta variable será accedida tanto por el hilo principal como el secundario
+# Variable compartida que almacena el número de ocurrencias de "ERROR"
+# Esta variable será accedida tanto por el hilo principal como el secundario.
+# No necesita cerrojo: el hilo secundario solo la escribe una vez, con una
+# única asignación de un int, y en CPython esa asignación es atómica gracias
+# al GIL (otras implementaciones de Python podrían no garantizarlo).
 contador_errores = 0
 
-# Semáforo binario (valor inicial = 1) para proteger el acceso a contador_errores
-# Solo un hilo puede acceder a la variable compartida a la vez
-semaforo = threading.Semaphore(1)
+# Evento para indicar que el hilo secundario ha terminado su trabajo.
+# Se activa después de escribir contador_errores, así que quien vea el
+# evento activado leerá siempre el valor final.
+hilo_terminado = threading.Event()
+
+# Tamaño mínimo (1 MiB) de cada tramo que se cuenta en paralelo, y del
+# búfer de lectura/escritura cuando no se usa mmap
+TAM_BLOQUE = 1 << 20
 
-# Bandera para indicar si el hilo secundario ha terminado su trabajo
-hilo_terminado = False
+# Tamaño de las losas (512 KiB, del orden de la caché L2) en las que cada hilo
+# recorre su tramo: mientras se busca en una losa sus bytes siguen en caché
+TAM_LOSA = 512 * 1024
+
+# Cada cuántos segundos se muestra el progreso del conteo
+INTERVALO_PROGRESO = 0.5
+
+# Número de líneas que se generan y escriben de una vez al crear el fichero
+LINEAS_POR_LOTE = 64 * 1024
 
 # ============================================================================
 # FUNCIÓN: Generar fichero de prueba
@@ -47,79 +86,437 @@ def generar_fichero_grande(nombre_archivo, num_lineas=5000):
         "ERROR: Permiso denegado"
     ]
     
-    # Crear el fichero y escribir líneas aleatorias
-    with open(nombre_archivo, 'w', encoding='utf-8') as f:
-        for i in range(num_lineas):
-            # Cada línea tiene un número y un mensaje aleatorio
-            linea = f"[{i+1}] {random.choice(mensajes_posibles)}\n"
-            f.write(linea)
+    # Codificar los mensajes a UTF-8 una sola vez, en lugar de codificar
+    # cada línea al escribirla en modo texto
+    mensajes_bytes = [m.encode('utf-8') for m in mensajes_posibles]
+
+    # Crear el fichero en modo binario y escribirlo por lotes de
+    # LINEAS_POR_LOTE líneas: una escritura por lote, y la memoria usada no
+    # crece con el número de líneas
+    with open(nombre_archivo, 'wb', buffering=TAM_BLOQUE) as f:
+        for inicio in range(0, num_lineas, LINEAS_POR_LOTE):
+            # Elegir los mensajes aleatorios del lote de una vez (una sola
+            # llamada en lugar de una llamada a random.choice por línea)
+            mensajes = random.choices(mensajes_bytes, k=min(LINEAS_POR_LOTE, num_lineas - inicio))
+
+            # Cada línea tiene un número y un mensaje aleatorio (el formateo
+            # %b de bytes se hace en C)
+            f.write(b"".join(
+                b"[%d] %b\n" % (i, msg) for i, msg in enumerate(mensajes, start=inicio + 1)
+            ))
     
     print(f"Fichero '{nombre_archivo}' generado correctamente.\n")
 
+# ============================================================================
+# FUNCIÓN: Núcleo de conteo compilado con Numba (opcional)
+# ============================================================================
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def contar_needle(buf, needle):
+        """
+        Cuenta las ocurrencias (sin solapamiento) de needle en buf.
+        Numba compila este bucle a código nativo y LLVM puede vectorizar
+        la comparación de bytes. Con nogil=True no retiene el GIL, así que
+        varios hilos pueden ejecutarlo a la vez.
+        
+        Args:
+            buf: Array uint8 con los bytes en los que buscar
+            needle: Array uint8 con los bytes a buscar
+        
+        Returns:
+            Tupla (ocurrencias, posición en buf tras la última ocurrencia)
+        """
+        n = buf.shape[0]
+        m = needle.shape[0]
+        # Una palabra vacía no avanzaría nunca
+        if m == 0:
+            return 0, 0
+        c = 0
+        fin_ultima = 0
+        i = 0
+        while i <= n - m:
+            ok = True
+            for j in range(m):
+                if buf[i + j] != needle[j]:
+                    ok = False
+                    break
+            if ok:
+                c += 1
+                i += m
+                fin_ultima = i
+            else:
+                i += 1
+        return c, fin_ultima
+
+    @functools.lru_cache(maxsize=None)
+    def needle_como_array(needle):
+        """Vista uint8 de needle, creada una sola vez por palabra clave"""
+        return np.frombuffer(needle, dtype=np.uint8)
+
+    # Compilar una vez al importar para no pagar el JIT en el primer conteo
+    contar_needle(np.frombuffer(b"ERROR", np.uint8), needle_como_array(b"ERROR"))
+else:
+    contar_needle = None
+
+@functools.lru_cache(maxsize=None)
+def preparar_patron(palabras):
+    """
+    Prepara las palabras clave para buscarlas sobre bytes.
+    El resultado se guarda en caché, así que las palabras se codifican (y la
+    expresión regular se compila) una sola vez aunque se cuente varias veces.
+    
+    Args:
+        palabras: Tupla de palabras clave (str o bytes)
+    
+    Returns:
+        Tupla (patron, largo_max): patron son los bytes de la palabra si solo
+        hay una, o una expresión regular compilada (A|B|C) si hay varias;
+        largo_max es la longitud en bytes de la palabra más larga
+    
+    Raises:
+        ValueError: Si no hay palabras clave o alguna está vacía (una
+            palabra vacía aparece en todas las posiciones y la búsqueda
+            no avanzaría nunca)
+    """
+    # Comparar bytes usa la búsqueda rápida de 8 bits de CPython en lugar de
+    # la de cadenas Unicode. Se codifica en UTF-8 (no ASCII) para admitir
+    # palabras con tildes
+    needles = [p if isinstance(p, bytes) else p.encode('utf-8') for p in palabras]
+    if not needles or b"" in needles:
+        raise ValueError("Las palabras clave no pueden estar vacías")
+
+    largo_max = max(len(n) for n in needles)
+
+    if len(needles) == 1:
+        return needles[0], largo_max
+    return re.compile(b"|".join(re.escape(n) for n in needles)), largo_max
+
+def contar_en_rango(mm, patron, pos, fin, limite):
+    """
+    Cuenta las ocurrencias de patron en mm[pos:fin] que empiezan antes de
+    limite.
+    Con una sola palabra usa la extensión en Cython o el núcleo de Numba si
+    están disponibles y mm.find en caso contrario; con varias palabras usa
+    una expresión regular.
+    
+    Args:
+        mm: Fichero proyectado en memoria (mmap)
+        patron: Bytes a buscar, o expresión regular compilada si hay
+            varias palabras clave
+        pos: Posición inicial de la búsqueda
+        fin: Posición final (exclusiva) de la búsqueda
+        limite: Solo se cuentan las ocurrencias que empiezan antes de esta
+            posición (fin la supera en largo_max - 1 bytes)
+    
+    Returns:
+        Tupla (ocurrencias, posición tras la última ocurrencia encontrada)
+    """
+    if fin <= pos:
+        return 0, pos
+
+    # Varias palabras clave: una sola pasada con la alternancia compilada
+    # (A|B|C) en lugar de recorrer el fichero una vez por palabra.
+    # Una coincidencia que empieza en limite o después puede estar cortada
+    # por fin (por ejemplo ERR en lugar de ERROR): se deja para la losa
+    # siguiente. Con una sola palabra no hace falta comprobarlo, porque una
+    # ocurrencia completa que cabe antes de fin siempre empieza antes de limite
+    if not isinstance(patron, bytes):
+        encontradas = 0
+        for coincidencia in patron.finditer(mm, pos, fin):
+            if coincidencia.start() >= limite:
+                break
+            encontradas += 1
+            pos = coincidencia.end()
+        return encontradas, pos
+
+    needle = patron
+    if count_ext is not None:
+        # memoryview sobre el mmap, sin copiar los datos. Se libera al salir
+        # del with para que el mmap se pueda cerrar después
+        with memoryview(mm)[pos:fin] as vista:
+            encontradas, fin_ultima = count_ext.count(vista, needle)
+        return encontradas, pos + fin_ultima
+
+    if contar_needle is not None:
+        # Vista uint8 sobre el mmap, sin copiar los datos
+        vista = np.frombuffer(mm, dtype=np.uint8, count=fin - pos, offset=pos)
+        try:
+            encontradas, fin_ultima = contar_needle(vista, needle_como_array(needle))
+        finally:
+            # Liberar la vista también si hay error: mientras exista, el
+            # mmap no se puede cerrar
+            del vista
+        return encontradas, pos + fin_ultima
+
+    # mm.find busca en C directamente sobre la memoria proyectada
+    encontradas = 0
+    while True:
+        p = mm.find(needle, pos, fin)
+        if p < 0:
+            break
+        encontradas += 1
+        pos = p + len(needle)
+    return encontradas, pos
+
+def contar_en_mmap(fd, total_bytes, patron, largo_max):
+    """
+    Cuenta las ocurrencias de patron en un fichero regular proyectándolo en
+    memoria con mmap: el contenido se lee directamente de la caché de páginas
+    del sistema operativo, sin copiarlo a objetos bytes ni pasar por la capa
+    de texto de open().
+    
+    Args:
+        fd: Descriptor del fichero abierto para lectura
+        total_bytes: Tamaño del fichero en bytes
+        patron: Bytes o expresión regular a buscar (ver contar_en_rango)
+        largo_max: Longitud en bytes de la palabra clave más larga
+    
+    Returns:
+        Número de ocurrencias encontradas
+    """
+    # mmap no admite ficheros vacíos (y no hay nada que contar)
+    if total_bytes == 0:
+        return 0
+
+    # Un tramo por núcleo, pero sin crear tramos de menos de TAM_BLOQUE
+    # bytes: en ficheros pequeños no compensa lanzar varios hilos.
+    # Solo la extensión en Cython y el núcleo de Numba sueltan el GIL;
+    # mm.find y la expresión regular lo mantienen, así que sin ellos los
+    # hilos no correrían en paralelo
+    tiene_nucleo = count_ext is not None or contar_needle is not None
+    if isinstance(patron, bytes) and tiene_nucleo:
+        num_tramos = max(1, min(os.cpu_count() or 1, total_bytes // TAM_BLOQUE))
+    else:
+        num_tramos = 1
+
+    # El fichero se lee una sola vez de principio a fin: pedir al sistema
+    # operativo una lectura anticipada más agresiva (no existe en Windows)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+    mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    try:
+        # Lo mismo para las páginas proyectadas en memoria
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        tramos = dividir_en_tramos(mm, total_bytes, num_tramos)
+
+        # Bytes procesados por cada tramo. Cada hilo solo escribe en su
+        # propia casilla, así que no hace falta cerrojo
+        progreso = array.array('Q', [0] * len(tramos))
+
+        # Hilo auxiliar que muestra el progreso mientras se cuenta, para no
+        # tener que comprobar nada en el bucle de búsqueda
+        conteo_terminado = threading.Event()
+        hilo_progreso = threading.Thread(
+            target=mostrar_progreso,
+            args=(progreso, total_bytes, conteo_terminado),
+            daemon=True
+        )
+        hilo_progreso.start()
+
+        try:
+            if len(tramos) == 1:
+                # Con un solo tramo se cuenta en este mismo hilo, sin crear
+                # el pool
+                total = contar_en_tramo(mm, patron, largo_max, *tramos[0], progreso, 0)
+            else:
+                # Cada hilo del pool cuenta un tramo; el resultado es la suma
+                with ThreadPoolExecutor(max_workers=len(tramos)) as ex:
+                    total = sum(ex.map(
+                        lambda i: contar_en_tramo(mm, patron, largo_max, *tramos[i], progreso, i),
+                        range(len(tramos))
+                    ))
+        finally:
+            conteo_terminado.set()
+            hilo_progreso.join()
+    finally:
+        mm.close()
+
+    # Ya no se va a volver a leer: liberar sus páginas de la caché
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    return total
+
+def mostrar_progreso(progreso, total_bytes, conteo_terminado):
+    """
+    Muestra cada INTERVALO_PROGRESO segundos los bytes procesados hasta que
+    se activa conteo_terminado.
+    
+    Args:
+        progreso: Array con los bytes procesados por cada tramo
+        total_bytes: Tamaño del fichero en bytes
+        conteo_terminado: Evento que se activa al terminar el conteo
+    """
+    while not conteo_terminado.wait(INTERVALO_PROGRESO):
+        sys.stdout.write(f"    Progreso: {sum(progreso)}/{total_bytes} bytes procesados\n")
+        sys.stdout.flush()
+
+def dividir_en_tramos(mm, total_bytes, num_tramos):
+    """
+    Divide el fichero en num_tramos tramos de tamaño parecido.
+    Cada tramo termina justo después de un salto de línea, así que ninguna
+    ocurrencia queda partida entre dos tramos.
+    
+    Args:
+        mm: Fichero proyectado en memoria (mmap)
+        total_bytes: Tamaño del fichero en bytes
+        num_tramos: Número de tramos deseado
+    
+    Returns:
+        Lista de tuplas (inicio, fin) que cubren todo el fichero
+    """
+    tramos = []
+    inicio = 0
+    for n in range(1, num_tramos + 1):
+        if n == num_tramos:
+            fin = total_bytes
+        else:
+            fin = mm.find(b"\n", total_bytes * n // num_tramos) + 1
+            if fin == 0:
+                fin = total_bytes
+        if fin > inicio:
+            tramos.append((inicio, fin))
+            inicio = fin
+        if inicio == total_bytes:
+            break
+    return tramos
+
+def contar_en_tramo(mm, patron, largo_max, inicio_tramo, fin_tramo, progreso, indice):
+    """
+    Cuenta las ocurrencias de patron en mm[inicio_tramo:fin_tramo].
+    Se ejecuta en los hilos del pool de contar_en_mmap.
+    
+    Args:
+        mm: Fichero proyectado en memoria (mmap)
+        patron: Bytes o expresión regular a buscar (ver contar_en_rango)
+        largo_max: Longitud en bytes de la palabra clave más larga
+        inicio_tramo: Posición inicial del tramo
+        fin_tramo: Posición final (exclusiva) del tramo
+        progreso: Array compartido con los bytes procesados por cada tramo
+        indice: Casilla de progreso que corresponde a este tramo
+    
+    Returns:
+        Número de ocurrencias encontradas en el tramo
+    """
+    total = 0
+    pos = inicio_tramo
+    # Recorrer el tramo losa a losa. Con varias palabras clave, la expresión
+    # regular las busca todas en la misma pasada sobre la losa, en lugar de
+    # recorrer el fichero (y volver a traerlo de memoria) una vez por palabra
+    for inicio in range(inicio_tramo, fin_tramo, TAM_LOSA):
+        # Se cuentan las ocurrencias que empiezan en la losa; el límite de
+        # búsqueda se amplía largo_max - 1 bytes para no perder las que
+        # quedan partidas entre dos losas
+        limite = min(inicio + TAM_LOSA, fin_tramo)
+        fin = min(limite + largo_max - 1, fin_tramo)
+        pos = max(pos, inicio)
+
+        encontradas, pos = contar_en_rango(mm, patron, pos, fin, limite)
+        total += encontradas
+        progreso[indice] = limite - inicio_tramo
+    return total
+
+def contar_en_flujo(fd, patron):
+    """
+    Cuenta las ocurrencias de patron leyendo el fichero línea a línea.
+    Se usa cuando el fichero no se puede proyectar en memoria (por ejemplo,
+    una tubería). El búfer de TAM_BLOQUE bytes reduce el número de lecturas
+    al sistema operativo frente a los 8 KiB por defecto.
+    
+    Args:
+        fd: Descriptor del fichero abierto para lectura
+        patron: Bytes o expresión regular a buscar (ver contar_en_rango)
+    
+    Returns:
+        Número de ocurrencias encontradas
+    """
+    total = 0
+    # closefd=False: el descriptor lo cierra quien lo abrió
+    with open(fd, 'rb', buffering=TAM_BLOQUE, closefd=False) as f:
+        # Las palabras clave no contienen saltos de línea, así que contar
+        # línea a línea da el mismo resultado que sobre el fichero completo
+        if isinstance(patron, bytes):
+            for linea in f:
+                total += linea.count(patron)
+        else:
+            for linea in f:
+                total += len(patron.findall(linea))
+    return total
+
 # ============================================================================
 # FUNCIÓN: Contar errores (ejecutada por el HILO SECUNDARIO)
 # ============================================================================
 def contar_errores_en_fichero(nombre_archivo, palabra_clave="ERROR"):
     """
     Función que será ejecutada por el hilo secundario.
-    Lee el fichero línea por línea y cuenta las ocurrencias de una palabra clave.
+    Lee el fichero como bytes y cuenta las ocurrencias de una o varias
+    palabras clave.
     
     Args:
         nombre_archivo: Ruta del fichero a procesar
-        palabra_clave: Palabra a buscar en cada línea (por defecto "ERROR")
+        palabra_clave: Palabra a buscar en el fichero (por defecto "ERROR"),
+            o lista de palabras (por ejemplo ["ERROR", "WARNING"]); cada
+            palabra puede ser str o bytes
     """
     # Declarar que usaremos las variables globales
-    global contador_errores, hilo_terminado
-    
-    print(f"🔄 Hilo secundario iniciado. Buscando '{palabra_clave}'...\n")
+    global contador_errores
     
     # Contador local temporal (no compartido)
     contador_local = 0
     
     try:
-        # Abrir el fichero para lectura
-        with open(nombre_archivo, 'r', encoding='utf-8') as f:
-            # Leer todas las líneas del fichero
-            lineas = f.readlines()
-            total_lineas = len(lineas)
-            
-            # Procesar cada línea del fichero
-            for i, linea in enumerate(lineas):
-                # SIMULAR PROCESAMIENTO LENTO
-                # Esto hace que el hilo tarde varios segundos en completar
-                time.sleep(0.001)  # Pausa de 1 milisegundo por línea
-                
-                # Verificar si la línea contiene la palabra clave
-                if palabra_clave in linea:
-                    contador_local += 1
-                
-                # Mostrar progreso cada 1000 líneas procesadas
-                if (i + 1) % 1000 == 0:
-                    print(f"    Progreso: {i+1}/{total_lineas} líneas procesadas")
+        # Las palabras clave pueden venir como str o ya como bytes
+        if isinstance(palabra_clave, (str, bytes)):
+            palabras = [palabra_clave]
+        else:
+            palabras = list(palabra_clave)
+        for p in palabras:
+            if not isinstance(p, (str, bytes)):
+                raise ValueError(f"Palabra clave no válida: {p!r}")
+        descripcion = ", ".join(
+            p.decode('utf-8', 'replace') if isinstance(p, bytes) else p
+            for p in palabras)
         
-        # ===================================================================
-        # SECCIÓN CRÍTICA: Actualizar la variable compartida
-        # ===================================================================
-        # ADQUIRIR el semáforo (bloquear el acceso para otros hilos)
-        semaforo.acquire()
+        # El hilo secundario escribe con sys.stdout.write y vacía la salida
+        # una sola vez al terminar, en lugar de hacerlo en cada mensaje
+        sys.stdout.write(f"🔄 Hilo secundario iniciado. Buscando '{descripcion}'...\n\n")
+        
+        # Las palabras clave se preparan antes de recorrer el fichero
+        patron, largo_max = preparar_patron(tuple(palabras))
+
+        fd = os.open(nombre_archivo, os.O_RDONLY)
         try:
-            # Actualizar la variable compartida de forma segura
-            contador_errores = contador_local
+            info = os.fstat(fd)
+            # Los ficheros regulares se proyectan en memoria; las tuberías y
+            # otros ficheros especiales no admiten mmap y se leen en flujo
+            if stat.S_ISREG(info.st_mode):
+                contador_local = contar_en_mmap(fd, info.st_size, patron, largo_max)
+            else:
+                contador_local = contar_en_flujo(fd, patron)
         finally:
-            # LIBERAR el semáforo (permitir acceso a otros hilos)
-            # El bloque finally garantiza que siempre se libere, incluso si hay error
-            semaforo.release()
-        # ===================================================================
+            os.close(fd)
+
+        # Actualizar la variable compartida con una única asignación
+        # (atómica en CPython, ver VARIABLES GLOBALES)
+        contador_errores = contador_local
         
-        print(f"\n Hilo secundario terminado. Se encontraron {contador_local} ocurrencias de '{palabra_clave}'.\n")
+        sys.stdout.write(f"\n Hilo secundario terminado. Se encontraron {contador_local} ocurrencias de '{descripcion}'.\n\n")
     
     except Exception as e:
         # Capturar cualquier error durante la lectura del fichero
-        print(f"\n Error en el hilo secundario: {e}\n")
+        sys.stdout.write(f"\n Error en el hilo secundario: {e}\n\n")
     
     finally:
+        # Si la salida ya no se puede escribir (por ejemplo, una tubería
+        # cerrada), el hilo debe marcarse como terminado igualmente
+        try:
+            sys.stdout.flush()
+        except OSError:
+            pass
         # Marcar que el hilo ha terminado (siempre se ejecuta)
-        hilo_terminado = True
+        hilo_terminado.set()
 
 # ============================================================================
 # FUNCIONES DEL MENÚ PRINCIPAL
@@ -157,20 +554,13 @@ def mostrar_mensaje():
 
 def mostrar_estado_contador():
     """
-    Muestra el estado actual del contador de forma segura.
-    Usa el semáforo para acceder a la variable compartida sin conflictos.
+    Muestra el estado actual del contador.
+    El evento hilo_terminado indica si el valor leído ya es el definitivo.
     """
-    # ADQUIRIR el semáforo antes de leer la variable compartida
-    semaforo.acquire()
-    try:
-        # Leer la variable compartida de forma segura
-        if hilo_terminado:
-            print(f"\n El conteo ha finalizado: {contador_errores} ocurrencias encontradas.\n")
-        else:
-            print(f"\n El hilo está procesando... Contador actual: {contador_errores}\n")
-    finally:
-        # LIBERAR el semáforo
-        semaforo.release()
+    if hilo_terminado.is_set():
+        print(f"\n El conteo ha finalizado: {contador_errores} ocurrencias encontradas.\n")
+    else:
+        print(f"\n El hilo está procesando... Contador actual: {contador_errores}\n")
 
 def calcular_suma():
     """Solicita dos números al usuario y muestra su suma"""
@@ -193,6 +583,11 @@ def main():
     - Muestra el menú principal y gestiona las opciones
     - Al salir, espera a que el hilo termine y muestra el resultado final
     """
+    # La salida estándar no se vacía en cada línea: se vacía explícitamente
+    # antes de pedir datos al usuario y cuando el hilo secundario termina
+    if hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    
     print("\n" + " PROGRAMA DE CONTEO DE PALABRAS CON HILOS ".center(50))
     print("="*50 + "\n")
     
@@ -230,6 +625,9 @@ def main():
     # procesa el fichero en segundo plano
     while True:
         mostrar_menu()
+        # Vaciar la salida para que el menú se vea completo antes de pedir
+        # la opción
+        sys.stdout.flush()
         opcion = input("Elige una opción (1-5): ").strip()
         
         # Procesar la opción seleccionada por el usuario
@@ -245,16 +643,13 @@ def main():
             print("\n Saliendo del programa...")
             
             # Si el hilo aún no ha terminado, esperamos a que finalice
-            if not hilo_terminado:
+            if not hilo_terminado.is_set():
                 print(" Esperando a que el hilo secundario termine...\n")
                 # join() bloquea el hilo principal hasta que el secundario termine
                 hilo.join()
             break  # Salir del bucle while
         else:
             print("\n❌ Opción no válida. Intenta de nuevo.\n")
-        
-        # Pequeña pausa para mejorar la legibilidad de la salida
-        time.sleep(0.5)
     
     # ========================================================================
     # PASO 4: Mostrar RESULTADO FINAL
@@ -263,12 +658,8 @@ def main():
     print("RESULTADO FINAL".center(50))
     print("="*50)
     
-    # Acceder a la variable compartida de forma segura con el semáforo
-    semaforo.acquire()
-    try:
-        print(f" Total de líneas con '{palabra_clave}': {contador_errores}")
-    finally:
-        semaforo.release()
+    # El hilo ya ha terminado, así que el valor es el definitivo
+    print(f" Total de ocurrencias de '{palabra_clave}': {contador_errores}")
     
     print("="*50 + "\n")
     print("Programa finalizado. ¡Hasta pronto! \n")
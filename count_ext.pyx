@@ -0,0 +1,65 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# ============================================================================
+# NÚCLEO DE CONTEO EN CYTHON (opcional)
+# ============================================================================
+# Extensión en C para contar las ocurrencias de una palabra clave.
+# Compilar (en el mismo directorio que EjercicioPractico3.py) con:
+#
+#     CFLAGS="-O3 -march=native" cythonize -i count_ext.pyx
+#
+# Si el módulo compilado no está disponible, EjercicioPractico3.py usa el
+# núcleo de Numba o mm.find.
+from libc.stdint cimport uint64_t
+from libc.string cimport memcmp
+
+def count(const unsigned char[::1] buf, bytes needle):
+    """
+    Cuenta las ocurrencias (sin solapamiento) de needle en buf.
+    El bucle se ejecuta sin el GIL, así que el hilo principal (el menú) y los
+    demás hilos de conteo siguen trabajando mientras tanto.
+
+    Antes de comparar cada ventana se consulta un filtro de Bloom de 64 bits
+    con los bytes de needle: si el último byte de la ventana no está en el
+    filtro, ninguna ventana que lo contenga puede coincidir y se salta
+    len(needle) posiciones de una vez.
+
+    Args:
+        buf: Bytes en los que buscar (bytes, mmap o memoryview contiguo)
+        needle: Bytes a buscar
+
+    Returns:
+        Tupla (ocurrencias, posición en buf tras la última ocurrencia)
+    """
+    cdef Py_ssize_t n = buf.shape[0]
+    cdef Py_ssize_t m = len(needle)
+    cdef Py_ssize_t i = 0
+    cdef Py_ssize_t c = 0
+    cdef Py_ssize_t fin_ultima = 0
+    cdef Py_ssize_t j
+    cdef uint64_t bloom = 0
+    cdef const unsigned char* p
+    cdef const unsigned char* q = <const unsigned char*><const char*>needle
+
+    if m == 0 or m > n:
+        return 0, 0
+
+    # Un bit por byte de needle (módulo 64)
+    for j in range(m):
+        bloom |= (<uint64_t>1) << (q[j] & 63)
+
+    p = &buf[0]
+    with nogil:
+        while i <= n - m:
+            # Filtro: el último byte de la ventana no aparece en needle
+            if not ((bloom >> (p[i + m - 1] & 63)) & 1):
+                i += m
+                continue
+
+            # Se compara el primer byte antes de llamar a memcmp
+            if p[i] == q[0] and memcmp(p + i, q, m) == 0:
+                c += 1
+                i += m
+                fin_ultima = i
+            else:
+                i += 1
+    return c, fin_ultima